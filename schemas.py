@@ -11,7 +11,7 @@ Model name is converted to lowercase for the collection name:
 - BlogPost -> "blogs" collection
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 
 # Example schemas (replace with your own):
@@ -44,6 +44,8 @@ class Analysis(BaseModel):
     YouTube content analyzer results
     Collection name: "analysis"
     """
+    model_config = ConfigDict(frozen=True)
+
     topic: str = Field(..., description="Video topic or idea")
     keywords: List[str] = Field(default_factory=list, description="List of keywords")
     niche: Optional[str] = Field(None, description="Content niche")